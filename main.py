@@ -10,6 +10,7 @@ in a designated directory, typically created using solana-keygen.
 """
 
 import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -52,7 +53,7 @@ def main() -> None:
     
     # Ensure the wallets directory exists, creating it if necessary
     # This prevents errors when the directory doesn't exist yet
-    Path(wallets_dir).mkdir(parents=True, exist_ok=True)
+    Path(wallets_dir).expanduser().mkdir(parents=True, exist_ok=True)
 
     # Discover all available wallets in the specified directory
     # This function returns a list of (file_path, public_key) tuples
@@ -68,11 +69,13 @@ def main() -> None:
         return
 
     # Display all discovered wallets to the user
-    print("Discovered wallets:")
-    for path_str, pubkey_str in entries:
-        # Show each wallet's file path and public key
-        # Error messages (if any) are included in pubkey_str
-        print(f"- {path_str}: {pubkey_str}")
+    # Each line shows a wallet's file path and public key; error messages (if any)
+    # are included in pubkey_str. The output is built first and written in one go
+    # instead of one print() per wallet.
+    sys.stdout.write(
+        "Discovered wallets:\n"
+        + "".join(f"- {path_str}: {pubkey_str}\n" for path_str, pubkey_str in entries)
+    )
 
 
 # Standard Python idiom to run main() when script is executed directly
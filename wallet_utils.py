@@ -11,12 +11,57 @@ Key Concepts:
 - The solders library is used for Solana cryptography operations
 """
 
+from __future__ import annotations
+
 import json
+import mmap
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+# solders is a large compiled extension, so it is imported lazily where a keypair
+# or public key is actually built. Listing an empty (or fully cached) wallets
+# directory then never pays its import cost.
+if TYPE_CHECKING:
+    from solders.keypair import Keypair
+
+# orjson parses straight from bytes and is much faster than the stdlib json module.
+# It is optional: fall back to json when it isn't installed.
+# A hand-written parser for the fixed "[n, n, ...]" key file shape is not worth it:
+# written in Python it is slower than both orjson and json.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    def _json_loads(data):
+        # json.loads() doesn't accept memoryview; bytes(b"...") is returned as-is
+        return json.loads(bytes(data))
+
+# Name of the public key cache file, stored inside the wallets directory.
+# The leading dot keeps it out of the wallet scan (see SKIPPED_NAME_PREFIXES).
+PUBKEY_CACHE_NAME = ".pubkey_cache.json"
+
+# Upper bound on threads used to load wallet files in parallel.
+# Loading is mostly file I/O, which releases the GIL, so we oversubscribe the CPUs.
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Maximum number of parsed keypairs kept in the in-process cache
+KEYPAIR_CACHE_SIZE = 4096
+
+# In-process keypair cache: path -> (stat fingerprint, Keypair).
+# Holding one entry per path means a replaced wallet's old key is dropped right away.
+_KEYPAIR_CACHE: Dict[str, Tuple[Tuple[int, ...], Keypair]] = {}
+_KEYPAIR_CACHE_LOCK = threading.Lock()
 
-from solders.keypair import Keypair
+# Files at least this large are memory-mapped instead of read into a bytes object.
+# Below it, setting up the mapping costs more than the copy it saves.
+MMAP_MIN_SIZE = 4096
+
+# File name prefixes that never belong to a wallet: hidden files (including macOS
+# "._" AppleDouble files) and editor lock/autosave files such as "#trader1.json"
+SKIPPED_NAME_PREFIXES = (".", "#")
 
 
 def load_keypair_from_json(json_path: os.PathLike | str) -> Keypair:
@@ -27,7 +72,7 @@ def load_keypair_from_json(json_path: os.PathLike | str) -> Keypair:
     into a Keypair object that can be used for signing transactions.
 
     Args:
-        json_path: Path to the JSON file containing the keypair data.
+        json_path: Path to the JSON file containing the keypair data (may start with ~).
                   The file should contain a JSON array of 64 integers representing
                   the keypair bytes (32-byte seed + 32-byte public key).
 
@@ -43,12 +88,93 @@ def load_keypair_from_json(json_path: os.PathLike | str) -> Keypair:
         keypair = load_keypair_from_json("wallets/trader1.json")
         public_key = keypair.pubkey()  # Get the public key
     """
-    # Convert the input path to a Path object for easier manipulation
-    path = Path(json_path)
-    
+    # Work with a plain string path - no Path object is needed here
+    # expanduser() turns ~/wallets into the user's home directory (no-op otherwise)
+    path = os.path.expanduser(os.fspath(json_path))
+
+    # Parsed keypairs are cached per process. Keying on the stat fingerprint means
+    # an edited or replaced wallet file is re-read automatically, with a single
+    # stat() per call.
+    return _parse_keypair_file(path, os.stat(path))
+
+
+def _parse_keypair_file(path_str: str, st: os.stat_result) -> Keypair:
+    """
+    Read and parse a keypair file (cached version of load_keypair_from_json).
+
+    The cached keypair is only reused while the file's mtime, ctime, inode and
+    size (the same fields as _cache_stamp()) are unchanged. mtime and size alone
+    miss a wallet replaced by ``cp -p`` or ``rsync -t``, and this is the signing path.
+    """
+    stamp = (st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size)
+    cached = _KEYPAIR_CACHE.get(path_str)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    kp = _keypair_from_bytes(_read_key_bytes(path_str, st.st_size))
+
+    with _KEYPAIR_CACHE_LOCK:
+        # Replace any stale entry for this path; evict the oldest entry when full
+        _KEYPAIR_CACHE.pop(path_str, None)
+        if len(_KEYPAIR_CACHE) >= KEYPAIR_CACHE_SIZE:
+            del _KEYPAIR_CACHE[next(iter(_KEYPAIR_CACHE))]
+        _KEYPAIR_CACHE[path_str] = (stamp, kp)
+    return kp
+
+
+def _keypair_from_bytes(secret_key_bytes: bytes) -> Keypair:
+    """
+    Build a Keypair from 32-byte (seed only) or 64-byte key bytes.
+
+    For 64 bytes, solders checks that the public half matches the seed and
+    raises ValueError ("signature error") if it doesn't.
+    """
+    from solders.keypair import Keypair
+
+    # A 32-byte file only holds the seed, which from_bytes() rejects
+    if len(secret_key_bytes) == 32:
+        return Keypair.from_seed(secret_key_bytes)
+
+    # Create and return a Keypair object using the solders library
+    # from_bytes() is the correct method to reconstruct a keypair from raw bytes
+    return Keypair.from_bytes(secret_key_bytes)
+
+
+def _read_key_bytes(path: str, size: int) -> bytes:
+    """
+    Read a key file and return its validated raw bytes (32 or 64 bytes).
+
+    ``size`` is the file size from an earlier stat(). It is only a hint for how
+    much to read and whether to memory-map the file: pipes and procfs files
+    report 0, and a file may have changed since the stat.
+
+    Raises:
+        ValueError: If the file format is invalid or the key length is unexpected.
+    """
     # Read and parse the JSON file content
     # The file should contain an array of integers representing bytes
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    # Parse the raw bytes directly - no need to decode to str first.
+    # A bare file descriptor avoids setting up any Python file object.
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if size < MMAP_MIN_SIZE:
+            # Normally the whole file comes in a single read(). Asking for one
+            # extra byte tells us whether the size was right; if not, read to EOF.
+            data = os.read(fd, size + 1)
+            if size == 0 or len(data) != size:
+                chunks = [data]
+                while data:
+                    data = os.read(fd, 65536)
+                    chunks.append(data)
+                data = b"".join(chunks)
+            raw = _json_loads(data)
+        else:
+            # Large files are parsed straight out of the mapping, without a copy
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    raw = _json_loads(view)
+    finally:
+        os.close(fd)
     
     # Validate that the JSON contains an array (list of integers)
     if not isinstance(raw, list):
@@ -66,10 +192,111 @@ def load_keypair_from_json(json_path: os.PathLike | str) -> Keypair:
         raise ValueError(
             f"Unexpected secret key length {len(secret_key_bytes)} in {path}"
         )
-    
-    # Create and return a Keypair object using the solders library
-    # from_bytes() is the correct method to reconstruct a keypair from raw bytes
-    return Keypair.from_bytes(secret_key_bytes)
+
+    return secret_key_bytes
+
+
+def _read_pubkey(json_file: str, size: int) -> str:
+    """
+    Return the public key string of a key file.
+
+    The keypair is always rebuilt from the key bytes rather than taking the
+    stored public half on trust: from_bytes() rejects a file whose public key
+    doesn't match its seed, so we never display an address we can't sign for.
+    The on-disk public key cache means this only runs for new or changed files.
+    """
+    return str(_keypair_from_bytes(_read_key_bytes(json_file, size)).pubkey())
+
+
+def _iter_json_files(base: Path) -> List[Tuple[str, os.stat_result]]:
+    """
+    Recursively collect all ``*.json`` files under a directory, with their stat.
+
+    This replaces ``Path.glob("**/*.json")`` with an explicit ``os.scandir`` walk.
+    ``scandir`` already knows each entry's file type from the directory listing,
+    so we can filter by name and type without issuing an extra stat per entry.
+    Matching files are stat'ed once here; callers reuse that result for cache
+    checks and to size their read instead of stat'ing the file again.
+
+    Args:
+        base: Directory to search (including subdirectories).
+
+    Returns:
+        List[Tuple[str, os.stat_result]]: (path, stat) pairs, sorted by path.
+        Paths are plain strings, as they are only displayed or opened.
+    """
+    found: List[Tuple[str, os.stat_result]] = []
+    # Stack-based depth-first walk instead of recursion.
+    # Directories are kept as plain strings - os.scandir() doesn't need Path objects.
+    stack = [os.fspath(base)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Skip directories we can't read (or a wallets_dir that is a file),
+            # like Path.glob() did, instead of failing the whole scan
+            continue
+        with it:
+            for entry in it:
+                # Directories are checked first, so one named "*.json" is still
+                # walked into rather than mistaken for a wallet file.
+                # Files are then filtered by name with plain str methods - it
+                # costs nothing (no glob pattern or regex), unlike a stat.
+                # Hidden and editor junk files are skipped without being opened.
+                # is_dir()/is_file() reuse the file type cached by scandir.
+                # Symlinked directories are not followed, to avoid loops.
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name.endswith(".json"):
+                    # Symlinked wallet files (e.g. to ~/.config/solana/id.json) are
+                    # followed; that costs a stat only for entries that are links.
+                    # Links whose target is missing are kept too, so loading them
+                    # reports the error instead of the wallet silently vanishing.
+                    if name.startswith(SKIPPED_NAME_PREFIXES):
+                        continue
+                    if entry.is_file() or entry.is_symlink():
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            try:
+                                # Dangling symlink: fall back to the link's own stat
+                                st = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                # Removed since the directory was listed
+                                continue
+                        found.append((entry.path, st))
+    # Sort once at the end to ensure consistent ordering.
+    # Compare component by component, the same order Path objects sort in.
+    found.sort(key=lambda item: item[0].split(os.sep))
+    return found
+
+
+def _load_one(
+    json_file: str, st: os.stat_result
+) -> Tuple[str, Union[Keypair, Exception]]:
+    """
+    Load a single wallet for the thread pool.
+
+    ``st`` comes from the directory scan, so the file isn't stat'ed again.
+    Exceptions are returned instead of raised so one bad file doesn't sink the batch.
+    """
+    try:
+        return json_file, _parse_keypair_file(json_file, st)
+    except Exception as exc:
+        return json_file, exc
+
+
+def _load_pubkey_one(json_file: str, size: int) -> Tuple[str, Union[str, Exception]]:
+    """
+    Load a single wallet's public key string for the thread pool.
+
+    The string conversion is done here so it also happens off the main thread.
+    """
+    try:
+        return json_file, _read_pubkey(json_file, size)
+    except Exception as exc:
+        return json_file, exc
 
 
 def load_all_wallets(wallets_dir: os.PathLike | str = "wallets") -> List[Keypair]:
@@ -78,7 +305,8 @@ def load_all_wallets(wallets_dir: os.PathLike | str = "wallets") -> List[Keypair
 
     This function scans a directory for all JSON files and attempts to load them
     as Solana keypairs. It's designed to be robust - if one wallet file is corrupted
-    or invalid, it will continue processing the others and report the error.
+    or invalid, it will continue processing the others and report the errors
+    to stderr once all files have been processed.
 
     Args:
         wallets_dir: Path to the directory containing wallet JSON files.
@@ -99,30 +327,99 @@ def load_all_wallets(wallets_dir: os.PathLike | str = "wallets") -> List[Keypair
         for wallet in wallets:
             print(f"Wallet public key: {wallet.pubkey()}")
     """
-    # Create a Path object for the wallets directory
-    base = Path(wallets_dir)
+    # Create a Path object for the wallets directory (expanding ~ if present)
+    base = Path(wallets_dir).expanduser()
     
     # If the directory doesn't exist, return an empty list
     if not base.exists():
         return []
     
-    # List to store successfully loaded keypairs
-    keypairs: List[Keypair] = []
-    
     # Search for all JSON files in the directory (including subdirectories)
-    # Sort them to ensure consistent ordering
-    for json_file in sorted(base.glob("**/*.json")):
-        try:
-            # Attempt to load the keypair from this JSON file
-            kp = load_keypair_from_json(json_file)
-            keypairs.append(kp)
-        except Exception as exc:  # keep going; report invalid files later
-            # If loading fails, print an error but continue with other files
-            print(f"Failed to load {json_file}: {exc}")
+    files = _iter_json_files(base)
+    if not files:
+        return []
+
+    # Load the files in parallel; map() keeps results in the (sorted) input order
+    paths = [json_file for json_file, _ in files]
+    stats = [st for _, st in files]
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(files))) as executor:
+        loaded = list(executor.map(_load_one, paths, stats))
+
+    # Keep the successfully loaded keypairs and continue past any failures
+    keypairs = [kp for _, kp in loaded if not isinstance(kp, Exception)]
+
+    # Collect failures and report them in a single write at the end,
+    # rather than one print() (and stdout lock/flush) per bad file
+    failures = [
+        f"Failed to load {json_file}: {exc}\n"
+        for json_file, exc in loaded
+        if isinstance(exc, Exception)
+    ]
+
+    if failures:
+        sys.stderr.write("".join(failures))
     
     return keypairs
 
 
+def _pubkey_cache_path(base: Path) -> Path:
+    """
+    Return the location of the public key cache for a wallets directory.
+
+    The cache lives in the wallets directory itself, so listing a directory
+    never writes anywhere else. Its dot-prefixed name is skipped by the
+    ``*.json`` scan, including when a parent directory is listed.
+    """
+    return base / PUBKEY_CACHE_NAME
+
+
+def _load_pubkey_cache(cache_path: Path) -> Dict[str, dict]:
+    """
+    Read the public key cache from disk.
+
+    The cache maps absolute wallet file paths to their stat fingerprint (see
+    _cache_stamp()) plus ``"pubkey": str``.
+    A missing or unreadable cache is treated as empty - it is only an optimization.
+    """
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _cache_stamp(st: os.stat_result) -> Dict[str, int]:
+    """
+    Return the stat fields that decide whether a cached public key is still valid.
+
+    mtime and size alone miss a wallet replaced by ``cp -p`` or ``rsync -t``.
+    The inode and ctime (which utime() can't set back) catch that, and all of
+    them come from the same stat() call.
+    """
+    return {
+        "mtime_ns": st.st_mtime_ns,
+        "ctime_ns": st.st_ctime_ns,
+        "ino": st.st_ino,
+        "size": st.st_size,
+    }
+
+
+def _save_pubkey_cache(cache_path: Path, cache: Dict[str, dict]) -> None:
+    """
+    Write the public key cache to disk.
+
+    The file is written to a temporary name and then moved into place so a
+    crash mid-write never leaves a truncated cache behind. Failures (e.g. a
+    read-only directory) are ignored since the cache is only an optimization.
+    """
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def list_public_keys_with_paths(wallets_dir: os.PathLike | str = "wallets") -> List[Tuple[str, str]]:
     """
     Get a list of wallet file paths and their corresponding public keys.
@@ -154,29 +451,69 @@ def list_public_keys_with_paths(wallets_dir: os.PathLike | str = "wallets") -> L
             else:
                 print(f"✅ {file_path}: {pubkey}")
     """
-    # Create a Path object for the wallets directory
-    base = Path(wallets_dir)
-    
-    # List to store results as (file_path, public_key_or_error) tuples
-    results: List[Tuple[str, str]] = []
+    # Create a Path object for the wallets directory (expanding ~ if present)
+    base = Path(wallets_dir).expanduser()
     
     # If the directory doesn't exist, return empty results
     if not base.exists():
-        return results
+        return []
     
+    # Load the public key cache so unchanged wallets don't need to be re-parsed
+    cache_path = _pubkey_cache_path(base)
+    cache = _load_pubkey_cache(cache_path)
+    # The cache is rebuilt from the files found in this scan, so entries for
+    # deleted wallets are dropped instead of accumulating forever
+    new_cache: Dict[str, dict] = {}
+
+    # Wallets that need to be loaded from disk: (index in results, path, cache key, stat)
+    misses = []
+
     # Search for all JSON files in the directory (including subdirectories)
-    # Sort them to ensure consistent ordering
-    for json_file in sorted(base.glob("**/*.json")):
-        try:
-            # Attempt to load the keypair from this JSON file
-            kp = load_keypair_from_json(json_file)
-            # Extract the public key and convert to string
-            public_key_str = str(kp.pubkey())
-            results.append((str(json_file), public_key_str))
-        except Exception as exc:
-            # If loading fails, include error information in the results
-            # This allows the caller to handle errors appropriately
-            results.append((str(json_file), f"<error: {exc}>"))
+    files = _iter_json_files(base)
+
+    # Results as (file_path, public_key_or_error) tuples.
+    # Pre-size the list; every slot is filled in below
+    results: List[Tuple[str, str]] = [("", "")] * len(files)
+
+    for index, (json_file, st) in enumerate(files):
+        # A wallet is considered unchanged if its stat fingerprint matches the cache
+        cache_key = os.path.abspath(json_file)
+        cached = cache.get(cache_key)
+        stamp = _cache_stamp(st)
+        # Anything malformed in the cache file is treated as a miss, never an error
+        if (
+            isinstance(cached, dict)
+            and isinstance(cached.get("pubkey"), str)
+            and all(cached.get(field) == value for field, value in stamp.items())
+        ):
+            results[index] = (json_file, cached["pubkey"])
+            new_cache[cache_key] = cached
+            continue
+
+        # Cache miss: the slot is filled in once the wallet has been loaded below
+        misses.append((index, json_file, cache_key, st))
+
+    if misses:
+        # Load the uncached wallets in parallel
+        miss_files = [json_file for _, json_file, _, _ in misses]
+        miss_sizes = [st.st_size for _, _, _, st in misses]
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(misses))) as executor:
+            loaded = list(executor.map(_load_pubkey_one, miss_files, miss_sizes))
+
+        for (index, json_file, cache_key, st), (_, public_key_str) in zip(misses, loaded):
+            if isinstance(public_key_str, Exception):
+                # If loading fails, include error information in the results
+                # This allows the caller to handle errors appropriately
+                results[index] = (json_file, f"<error: {public_key_str}>")
+                continue
+
+            results[index] = (json_file, public_key_str)
+            # Remember the public key for the next run
+            new_cache[cache_key] = {**_cache_stamp(st), "pubkey": public_key_str}
+
+    # Flush the cache once, and only if something changed
+    if new_cache != cache:
+        _save_pubkey_cache(cache_path, new_cache)
     
     return results
 